@@ -1,3 +1,4 @@
+import sys
 from types import MethodType
 
 class FieldNotImplemented(Exception):
@@ -18,6 +19,9 @@ class Field(object):
         This must be called before any other methods are called on the
         Field."""
         self._form = form
+        # The full name is used as the key for this field's value, so build
+        # (and intern) it once rather than on every lookup
+        self._full_name = sys.intern(f'{form.name()}.{self._name}')
 
     def form(self, form_name=None):
         if form_name is None:
@@ -33,7 +37,7 @@ class Field(object):
         return self._name
 
     def name(self):
-        return f'{self._form.name()}.{self._name}'
+        return self._full_name
 
     def not_implemented(self, detailed=None):
         """Can be called by a field it encounters a scenario which it does not
@@ -92,6 +96,7 @@ class FloatField(BasicTypedField):
     def __init__(self, name, value_fn, places=2):
         self._empty_value = 0.0
         self._places = places
+        self._format_spec = f'.{places}f'
         super().__init__(name, value_fn, float)
 
     def value(self, inputs, values):
@@ -99,7 +104,7 @@ class FloatField(BasicTypedField):
         return round(value, self._places)
 
     def to_string(self, value):
-        return f'{value:.{self._places}f}'
+        return format(value, self._format_spec)
 
     def from_string(self, string):
         return round(float(string), self._places)
@@ -1,5 +1,8 @@
 from collections.abc import Mapping
 from enum import IntEnum, auto, unique
+from functools import lru_cache
+import sys
+from types import MappingProxyType
 
 from habutax.inputs import (StringInput,
                             BooleanInput,
@@ -14,6 +17,10 @@ from habutax.fields import (StringField,
                             EnumField)
 
 
+# Sentinel for threshold lookups, so each lookup only hashes its key once
+_MISSING = object()
+
+
 class AutoNumber(IntEnum):
     def _generate_next_value_(name, start, count, last_values):
         return 0 if len(last_values) == 0 else max(last_values) + 1
@@ -96,7 +103,11 @@ class Form(object):
         self._inputs = inputs
         self._required_fields = required_fields
         self._optional_fields = optional_fields
-        self._thresholds = thresholds
+        if isinstance(thresholds, FrozenThresholds):
+            # Already flattened by FrozenThresholds, and safe to share
+            self._thresholds = thresholds
+        else:
+            self._thresholds = flatten_thresholds(thresholds)
         self._pdf_fields = pdf_fields
         self._pdf_file = pdf_file
         self._instance = instance
@@ -133,17 +144,13 @@ class Form(object):
         return self.required_fields() + self._optional_fields
 
     def threshold(self, name, requested_key=None):
-        assert name in self._thresholds, f'No threshold named "{name}" was found for form {self.name()}'
-        t = self._thresholds[name]
-        if isinstance(t, dict):
+        t = self._thresholds.get(name, _MISSING)
+        assert t is not _MISSING, f'No threshold named "{name}" was found for form {self.name()}'
+        if isinstance(t, (dict, MappingProxyType)):
             assert requested_key is not None, f'Threshold "{name}" for form {self.name()} requires requested key to be supplied, but it was not'
-            for key, value in t.items():
-                if isinstance(key, type(requested_key)):
-                    if key == requested_key:
-                        return value
-                elif requested_key in key:
-                    return value
-            assert False, f'Threshold "{name}" not found for requested key {requested_key} for form {self.name()}'
+            value = t.get(requested_key, _MISSING)
+            assert value is not _MISSING, f'Threshold "{name}" not found for requested key {requested_key} for form {self.name()}'
+            return value
         else:
             assert requested_key is None, f'Threshold "{name}" for form {self.name()} did not expect a requested key to be supplied'
             return t
@@ -206,6 +213,12 @@ class FormAccessor(Mapping):
             key = f'{self.form.name()}.{key}'
         return self.mapping[key]
 
+    def getmany(self, keys):
+        """Return a list of the values of `keys` (a tuple), looked up as they
+        would be individually, but without a call to __getitem__() each"""
+        mapping = self.mapping
+        return [mapping[k] for k in qualified_names(self.form.name(), keys)]
+
     def __iter__(self):
         return iter(self.mapping)
 
@@ -221,3 +234,55 @@ def name_and_instance(full_form_name):
     elif len(split_form_name) != 1:
         raise RuntimeError(f'Unexpected form name: {full_form_name} (expected 0 or 1 colons)')
     return split_form_name[0], form_instance
+
+
+@lru_cache(maxsize=None)
+def qualified_names(form_name, names):
+    """Return a tuple of `names`, with any not already containing a form name
+    qualified with `form_name`"""
+    return tuple(n if "." in n else sys.intern(f'{form_name}.{n}') for n in names)
+
+
+@lru_cache(maxsize=None)
+def instance_field_names(form_name, field_name, count):
+    """Return a tuple of the full names of `field_name` for the first `count`
+    instances of `form_name` (i.e. 'w-2:0.box_1', 'w-2:1.box_1', ...). These
+    are interned, as are field names, so looking their values up can compare
+    the names by identity"""
+    return tuple(sys.intern(f'{form_name}:{n}.{field_name}') for n in range(count))
+
+
+def flatten_thresholds(thresholds):
+    """Expand any tuple keys in second-level threshold dictionaries into one
+    entry per key, so that thresholds can be looked up directly by key"""
+    flattened = {}
+    for name, t in thresholds.items():
+        if isinstance(t, dict):
+            flat = {}
+            for key, value in t.items():
+                for k in (key if isinstance(key, tuple) else (key,)):
+                    assert k not in flat, f'Threshold "{name}" has more than one value for key {k}'
+                    flat[k] = value
+            t = flat
+        flattened[name] = t
+    return flattened
+
+
+class FrozenThresholds(Mapping):
+    """Thresholds which have already been flattened (see flatten_thresholds()),
+    and which can't be modified at either level, so that form instances can
+    share them rather than each flattening their own copy"""
+
+    def __init__(self, thresholds):
+        self._thresholds = {name: MappingProxyType(t) if isinstance(t, dict) else t
+                            for name, t in flatten_thresholds(thresholds).items()}
+
+    def __getitem__(self, name):
+        return self._thresholds[name]
+
+    def __iter__(self):
+        return iter(self._thresholds)
+
+    def __len__(self):
+        return len(self._thresholds)
+
@@ -1,13 +1,243 @@
+import functools
+import math
 import os
 
 import habutax.enum as enum
-from habutax.form import Form, Jurisdiction
+from habutax.enum import filing_status as status
+from habutax.form import Form, FrozenThresholds, Jurisdiction, instance_field_names
 from habutax.inputs import *
 from habutax.fields import *
 from habutax.pdf_fields import *
 
 from habutax.forms.ty2023.f1040_figure_tax import figure_tax
 
+# These do not vary between Form1040 instances, so are only built once
+THRESHOLDS = FrozenThresholds({
+    # Form 1040, line 2b instructions
+    'sched_b_required_interest': 1500.00,
+    # Form 1040, line 3b instructions
+    'sched_b_required_dividends': 1500.00,
+    # Form 1040, Standard Deduction sidebar
+    'standard_deduction': {
+        (status.Single, status.MarriedFilingSeparately): 13850.00,
+        (status.MarriedFilingJointly, status.QualifyingSurvivingSpouse): 27700.00,
+        status.HeadOfHousehold: 20800.00,
+    },
+    # Form 1040 line 13 instructions regarding Qualified Business
+    # Income (also found on Form 8995)
+    'form_8995_required': {
+        status.MarriedFilingJointly: 364200.00,
+        (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 182100.00,
+    },
+    # Additional Medicare Tax Thresholds from Form 8959 Instructions
+    # (note: these are not inflation-indexed so probably shouldn't
+    # change)
+    'additional_medicare_tax_withheld': 200000,
+    'additional_medicare_tax_applies': {
+        status.MarriedFilingJointly:    250000.0,
+        status.MarriedFilingSeparately: 125000.0,
+        (status.Single, status.QualifyingSurvivingSpouse,
+         status.HeadOfHousehold):       200000.0
+    },
+
+    # EIC eligibility, from Form 1040 line 27 instructions
+    'eic_disallowed_3_dependents': {
+        (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 56838.0,
+        status.MarriedFilingJointly: 63398.0,
+    },
+    'eic_disallowed_2_dependents': {
+        (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 52918.0,
+        status.MarriedFilingJointly: 59478.0,
+    },
+    'eic_disallowed_1_dependents': {
+        (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 46560.0,
+        status.MarriedFilingJointly: 53120.0,
+    },
+    'eic_disallowed_0_dependents': {
+        (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 17640.0,
+        status.MarriedFilingJointly: 24210.0,
+    },
+    'eic_max_investment_income': 11000.0,
+    # Form 1040 instructions, line 38. You may owe a tax penalty if
+    # "Line 37 is at least $1,000 and it is more than 10% of the tax
+    # shown on your return"
+    'tax_penalty_dollars': 1000.0,
+    'tax_penalty_pct': 0.1,  # 10%
+})
+
+# Names of the EIC income limit thresholds, indexed by the number of dependents
+# (with 3 or more dependents sharing the last)
+EIC_DISALLOWED_THRESHOLDS = tuple(f'eic_disallowed_{n}_dependents' for n in range(4))
+
+# The lines totaled to give each of these lines
+TOTALED_LINES = {
+    '1z': ('1a', '1b', '1c', '1d', '1e', '1f', '1g', '1h', '1i'),
+    '9': ('1z', '2b', '3b', '4b', '5b', '6b', '7', '8'),
+    '14': ('12', '13'),
+    '18': ('16', '17'),
+    '21': ('19', '20'),
+    '24': ('22', '23'),
+    '25d': ('25a', '25b', '25c'),
+    '32': ('27', '28', '29', '31'),
+    '33': ('25d', '26', '32'),
+}
+
+# (input type, name, description) of the inputs for each of the dependents
+# listed on page 1 of Form 1040. These are only formatted once, but the Input
+# objects themselves are bound to the form they belong to, so must still be
+# created for each Form1040 instance.
+DEPENDENT_INPUTS = tuple(spec for n in range(4) for spec in (
+    (StringInput, f'dependent_{n}_name', f'Enter the first and last name for dependent {n+1}'),
+    (SSNInput, f'dependent_{n}_ssn', f'Enter the Social Security number for dependent {n+1}'),
+    (StringInput, f'dependent_{n}_relationship', f'What is the relationship of {n+1} to you?'),
+    (BooleanInput, f'dependent_{n}_ctc', f'Does dependent {n+1} qualify for the child tax credit? See the "Who Qualifies as Your Dependent" section in the instructions for Form 1040.'),
+    (BooleanInput, f'dependent_{n}_odc', f'Does dependent {n+1} qualify for the credit for other dependents? See the "Who Qualifies as Your Dependent" section in the instructions for Form 1040.'),
+))
+
+# Shared between Form1040 instances (see PDFField)
+PDF_FIELDS = (
+#    TextPDFField('topmostSubform[0].Page1[0].f1_01[0]', 'tax_year_begin_month'),
+#    TextPDFField('topmostSubform[0].Page1[0].f1_02[0]', 'tax_year_end_month'),
+#    TextPDFField('topmostSubform[0].Page1[0].f1_03[0]', 'tax_year_20xx', max_length=2),
+    TextPDFField('topmostSubform[0].Page1[0].f1_04[0]', 'first_name'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_05[0]', 'last_name'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_06[0]', 'you_ssn', max_length=9),
+    TextPDFField('topmostSubform[0].Page1[0].f1_07[0]', 'spouse_first_name'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_08[0]', 'spouse_last_name'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_09[0]', 'spouse_ssn', max_length=9),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_10[0]', 'home_address'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_11[0]', 'apartment_no'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_12[0]', 'city'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_13[0]', 'state'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_14[0]', 'zip'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_15[0]', 'foreign_country'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_16[0]', 'foreign_province'),
+    TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_17[0]', 'foreign_postal_code'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_1[0]', 'you_presidential_election', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_2[0]', 'spouse_presidential_election', '1'),
+    EnumButtonPDFField('topmostSubform[0].Page1[0].c1_3[0]', 'filing_status', '1', status.Single),
+    EnumButtonPDFField('topmostSubform[0].Page1[0].c1_3[1]', 'filing_status', '2', status.HeadOfHousehold),
+    EnumButtonPDFField('topmostSubform[0].Page1[0].c1_3[2]', 'filing_status', '3', status.MarriedFilingJointly),
+    EnumButtonPDFField('topmostSubform[0].Page1[0].c1_3[3]', 'filing_status', '4', status.MarriedFilingSeparately),
+    EnumButtonPDFField('topmostSubform[0].Page1[0].c1_3[4]', 'filing_status', '5', status.QualifyingSurvivingSpouse),
+#    TextPDFField('topmostSubform[0].Page1[0].f1_18[0]', 'additional_name'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_4[0]', 'digital_assets', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_4[1]', 'digital_assets', '2', value_fn=lambda s, v, f: not v),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_5[0]', 'you_as_dependent', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_6[0]', 'spouse_as_dependent', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_7[0]', 'spouse_itemize_or_alien', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_8[0]', 'old', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_9[0]', 'blind', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_10[0]', 'spouse_old', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].c1_11[0]', 'spouse_blind', '1'),
+#    ButtonPDFField('topmostSubform[0].Page1[0].Dependents_ReadOrder[0].c1_12[0]', 'more_than_4_dependents', '1'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].f1_19[0]', 'dependent_0_name'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].f1_20[0]', 'dependent_0_ssn', max_length=9),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].f1_21[0]', 'dependent_0_relationship'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].c1_13[0]', 'dependent_0_ctc', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].c1_14[0]', 'dependent_0_odc', '1'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].f1_22[0]', 'dependent_1_name'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].f1_23[0]', 'dependent_1_ssn', max_length=9),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].f1_24[0]', 'dependent_1_relationship'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].c1_15[0]', 'dependent_1_ctc', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].c1_16[0]', 'dependent_1_odc', '1'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].f1_25[0]', 'dependent_2_name'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].f1_26[0]', 'dependent_2_ssn', max_length=9),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].f1_27[0]', 'dependent_2_relationship'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].c1_17[0]', 'dependent_2_ctc', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].c1_18[0]', 'dependent_2_odc', '1'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].f1_28[0]', 'dependent_3_name'),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].f1_29[0]', 'dependent_3_ssn', max_length=9),
+    TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].f1_30[0]', 'dependent_3_relationship'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].c1_19[0]', 'dependent_3_ctc', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].c1_20[0]', 'dependent_3_odc', '1'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_31[0]', '1a'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_32[0]', '1b'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_33[0]', '1c'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_34[0]', '1d'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_35[0]', '1e'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_36[0]', '1f'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_37[0]', '1g'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_38[0]', '1h'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_39[0]', '1i'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_40[0]', '1z'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_41[0]', '2a'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_42[0]', '2b'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_43[0]', '3a'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_44[0]', '3b'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_45[0]', '4a'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_46[0]', '4b'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_47[0]', '5a'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_48[0]', '5b'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_49[0]', '6a'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_50[0]', '6b'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].c1_21[0]', '6c', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].c1_22[0]', '7_checkbox', '1'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_51[0]', '7'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_52[0]', '8'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_53[0]', '9'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_54[0]', '10'),
+    TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_55[0]', '11'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_56[0]', '12'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_57[0]', '13'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_58[0]', '14'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_59[0]', '15'),
+#    ButtonPDFField('topmostSubform[0].Page2[0].c2_1[0]', '8814_tax', '1'),
+#    ButtonPDFField('topmostSubform[0].Page2[0].c2_2[0]', '4974_tax', '1'),
+#    ButtonPDFField('topmostSubform[0].Page2[0].c2_3[0]', 'other_tax', '1'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_01[0]', 'other_tax_description'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_02[0]', '16'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_03[0]', '17'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_04[0]', '18'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_05[0]', '19'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_06[0]', '20'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_07[0]', '21'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_08[0]', '22'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_09[0]', '23'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_10[0]', '24'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_11[0]', '25a'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_12[0]', '25b'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_13[0]', '25c'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_14[0]', '25d'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_15[0]', '26'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_16[0]', '27'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_17[0]', '28'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_18[0]', '29'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_19[0]', 'reserved'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_20[0]', '31'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_21[0]', '32'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_22[0]', '33'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_23[0]', '34'),
+#    ButtonPDFField('topmostSubform[0].Page2[0].c2_4[0]', 'form_8888', '1'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_24[0]', '35a'),
+    TextPDFField('topmostSubform[0].Page2[0].RoutingNo[0].f2_25[0]', '35b', max_length=9),
+    ButtonPDFField('topmostSubform[0].Page2[0].c2_5[0]', '35c', '1'),
+    ButtonPDFField('topmostSubform[0].Page2[0].c2_5[1]', '35c', '2', value_fn=lambda s, v, f: not v),
+    TextPDFField('topmostSubform[0].Page2[0].AccountNo[0].f2_26[0]', '35d', max_length=17),
+    TextPDFField('topmostSubform[0].Page2[0].f2_27[0]', '36'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_28[0]', '37'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_29[0]', '38'),
+    ButtonPDFField('topmostSubform[0].Page2[0].c2_6[0]', 'designee', '1'),
+    ButtonPDFField('topmostSubform[0].Page2[0].c2_6[1]', 'designee', '2', value_fn=lambda s, v, f: not v),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_30[0]', 'designee_name'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_31[0]', 'designee_phone'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_32[0]', 'designee_pin', max_length=5),
+    TextPDFField('topmostSubform[0].Page2[0].f2_33[0]', 'occupation'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_34[0]', 'you_pin', max_length=6),
+    TextPDFField('topmostSubform[0].Page2[0].f2_35[0]', 'spouse_occupation'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_36[0]', 'spouse_pin', max_length=6),
+    TextPDFField('topmostSubform[0].Page2[0].f2_37[0]', 'phone_number'),
+    TextPDFField('topmostSubform[0].Page2[0].f2_38[0]', 'email_address'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_39[0]', 'preparer_name'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_40[0]', 'ptin', max_length=11),
+#    ButtonPDFField('topmostSubform[0].Page2[0].c2_7[0]', 'preparer_self-employed', '1'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_41[0]', 'preparer_firm'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_42[0]', 'preparer_ph'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_43[0]', 'preparer_firm'),
+#    TextPDFField('topmostSubform[0].Page2[0].f2_44[0]', 'prep_ein', max_length=10),
+)
+PDF_FILE = os.path.join(os.path.dirname(__file__), 'f1040.pdf')
+
 class Form1040(Form):
     form_name = "1040"
     tax_year = 2023
@@ -17,59 +247,6 @@ class Form1040(Form):
     sequence_no = 0
 
     def __init__(self, **kwargs):
-        status = enum.filing_status
-        thresholds = {
-            # Form 1040, line 2b instructions
-            'sched_b_required_interest': 1500.00,
-            # Form 1040, line 3b instructions
-            'sched_b_required_dividends': 1500.00,
-            # Form 1040, Standard Deduction sidebar
-            'standard_deduction': {
-                (status.Single, status.MarriedFilingSeparately): 13850.00,
-                (status.MarriedFilingJointly, status.QualifyingSurvivingSpouse): 27700.00,
-                status.HeadOfHousehold: 20800.00,
-            },
-            # Form 1040 line 13 instructions regarding Qualified Business
-            # Income (also found on Form 8995)
-            'form_8995_required': {
-                status.MarriedFilingJointly: 364200.00,
-                (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 182100.00,
-            },
-            # Additional Medicare Tax Thresholds from Form 8959 Instructions
-            # (note: these are not inflation-indexed so probably shouldn't
-            # change)
-            'additional_medicare_tax_withheld': 200000,
-            'additional_medicare_tax_applies': {
-                status.MarriedFilingJointly:    250000.0,
-                status.MarriedFilingSeparately: 125000.0,
-                (status.Single, status.QualifyingSurvivingSpouse,
-                 status.HeadOfHousehold):       200000.0
-            },
-
-            # EIC eligibility, from Form 1040 line 27 instructions
-            'eic_disallowed_3_dependents': {
-                (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 56838.0,
-                status.MarriedFilingJointly: 63398.0,
-            },
-            'eic_disallowed_2_dependents': {
-                (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 52918.0,
-                status.MarriedFilingJointly: 59478.0,
-            },
-            'eic_disallowed_1_dependents': {
-                (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 46560.0,
-                status.MarriedFilingJointly: 53120.0,
-            },
-            'eic_disallowed_0_dependents': {
-                (status.Single, status.MarriedFilingSeparately, status.QualifyingSurvivingSpouse, status.HeadOfHousehold): 17640.0,
-                status.MarriedFilingJointly: 24210.0,
-            },
-            'eic_max_investment_income': 11000.0,
-            # Form 1040 instructions, line 38. You may owe a tax penalty if
-            # "Line 37 is at least $1,000 and it is more than 10% of the tax
-            # shown on your return"
-            'tax_penalty_dollars': 1000.0,
-            'tax_penalty_pct': 0.1,  # 10%
-        }
 
         inputs = [
             StringInput('first_name', description="Your first name"),
@@ -149,37 +326,100 @@ class Form1040(Form):
             BooleanInput('form_4797', description="Did you sell business property in 2023 or otherwise need to file Form 4797?"),
             BooleanInput('postsecondary_education_expenses', description="Did you pay any qualified education expenses to an eligible postsecondary educational institution in 2023? See instructions for Schedule 3, line 3 and Form 8863 for more information"),
             FloatInput('apply_to_estimated_tax', description="Enter the dollar amount of your refund you want to apply to your 2023 estimated tax. This will reduce your refund for this year."),
-            RegexInput('routing_number', '^(0[1-9]|1[0-2]|2[1-9]|3[0-2])[0-9]{7}$', description="What is the routing number of the account in your name into which you want your refund deposited? (must be 9 digits)"),
+            RoutingNumberInput('routing_number', description="What is the routing number of the account in your name into which you want your refund deposited? (must be 9 digits)"),
             BooleanInput('checking_account', description="Is the account you want your refund deposited into a checking account? (savings account is assumed otherwise)"),
             RegexInput('account_number', '^[0-9A-Za-z\-]{1,17}$', description="What is the account number of the account in your name into which you want your refund deposited?"),
             FloatInput('tax_penalty', description="You may owe a tax penalty for not paying enough taxes. Please complete Form 2210 to determine if you owe a penalty (and the amount, if so) and enter the result here."),
         ]
 
-        for n in range(4):
-            inputs += [
-                StringInput(f'dependent_{n}_name', description=f'Enter the first and last name for dependent {n+1}'),
-                SSNInput(f'dependent_{n}_ssn', description=f'Enter the Social Security number for dependent {n+1}'),
-                StringInput(f'dependent_{n}_relationship', description=f'What is the relationship of {n+1} to you?'),
-                BooleanInput(f'dependent_{n}_ctc', description=f'Does dependent {n+1} qualify for the child tax credit? See the "Who Qualifies as Your Dependent" section in the instructions for Form 1040.'),
-                BooleanInput(f'dependent_{n}_odc', description=f'Does dependent {n+1} qualify for the credit for other dependents? See the "Who Qualifies as Your Dependent" section in the instructions for Form 1040.'),
-            ]
+        inputs += [input_type(name, description=description) for input_type, name, description in DEPENDENT_INPUTS]
+
+        # Intermediate results which are needed by more than one field, such as
+        # the values of a single box across every instance of an input form
+        # (W-2, 1099-INT, etc.). Solved values never change once set, so these
+        # are shared between all the fields which need them rather than re-read
+        # for each one.
+        cache = {}
+
+        def boxes(i, v, form_name, box):
+            """Return a list containing the value of `box` for each instance of
+            `form_name` (i.e. each W-2) the taxpayer has"""
+            key = (form_name, box)
+            if key not in cache:
+                cache[key] = [v[k] for k in instance_field_names(form_name, box, i[f'number_{form_name}'])]
+            return cache[key]
+
+        def box_total(i, v, form_name, box):
+            """Return the total of `box` across every instance of `form_name`.
+            Fields which are retried after reading a total (because of a later
+            unmet dependency) don't need to re-add it."""
+            key = (form_name, box, 'total')
+            if key not in cache:
+                cache[key] = math.fsum(boxes(i, v, form_name, box))
+            return cache[key]
+
+        def memoized(fn):
+            """Decorate a function computing several lines at once so that it is
+            only run to completion once, no matter how many of its lines are
+            solved"""
+            key = ('memoized', fn)
+            @functools.wraps(fn)
+            def wrapper(self, i, v):
+                if key not in cache:
+                    cache[key] = fn(self, i, v)
+                return cache[key]
+            return wrapper
+
+        def scan_1099_r(i, v):
+            """Total all Forms 1099-R in a single pass, returning a tuple of (IRA
+            distributions for you, IRA distributions for your spouse, other
+            distributions, taxable amount of other distributions, and whether
+            the taxable amount of any of the other distributions was not
+            determined)"""
+            if '1099-r' not in cache:
+                ira_you = 0.0
+                ira_spouse = 0.0
+                distributions = 0.0
+                taxable_amount = 0.0
+                not_determined = False
+                taxpayer = enum.taxpayer_or_spouse.taxpayer
+                spouse = enum.taxpayer_or_spouse.spouse
+
+                count = i['number_1099-r']
+                for box_1, box_2a, box_2b_not_determined, ira, belongs_to in zip(instance_field_names('1099-r', 'box_1', count),
+                                                                                instance_field_names('1099-r', 'box_2a', count),
+                                                                                instance_field_names('1099-r', 'box_2b_taxable_not_determined', count),
+                                                                                instance_field_names('1099-r', 'box_7_ira_sep_simple', count),
+                                                                                instance_field_names('1099-r', 'belongs_to', count)):
+                    if v[ira]:
+                        whose = v[belongs_to]
+                        if whose == taxpayer:
+                            ira_you += v[box_1]
+                        elif whose == spouse:
+                            ira_spouse += v[box_1]
+                    else:
+                        not_determined = not_determined or v[box_2b_not_determined]
+                        distributions += v[box_1]
+                        taxable_amount += v[box_2a]
+
+                cache['1099-r'] = (ira_you, ira_spouse, distributions, taxable_amount, not_determined)
+            return cache['1099-r']
 
         def full_names(self, i, v):
             names = [f'{v["first_name"]} {v["last_name"]}']
-            if i['filing_status'] == status.MarriedFilingJointly:
+            if v['married_filing_jointly']:
                 names.append(f'{v["spouse_first_name"]} {v["spouse_last_name"]}')
             return ", ".join(names)
 
         def line_1a(self, i, v):
             """Total Amount From Form(s) W-2, Box 1"""
-            for n in range(i['number_w-2']):
-                if v[f'w-2:{n}.box_13_statutory']:
-                    self.not_implemented()
-            return sum([v[f'w-2:{n}.box_1'] for n in range(i['number_w-2'])]) if i['number_w-2'] > 0 else None
+            if any(boxes(i, v, 'w-2', 'box_13_statutory')):
+                self.not_implemented()
+            return box_total(i, v, 'w-2', 'box_1') if i['number_w-2'] > 0 else None
 
         def line_2b(self, i, v):
             """taxable interest"""
-            total = sum([v[f'1099-int:{n}.box_1'] + v[f'1099-int:{n}.box_3'] for n in range(i['number_1099-int'])])
+            total = box_total(i, v, '1099-int', 'box_1') + box_total(i, v, '1099-int', 'box_3')
             if total > self.threshold('sched_b_required_interest'):
                 return v['1040_sb.4']  # Schedule B
             elif i['number_1099-oid'] > 0:
@@ -189,88 +429,86 @@ class Form1040(Form):
 
         def line_3a(self, i, v):
             """qualified dividends"""
-            total = sum([v[f'1099-div:{n}.box_1b'] for n in range(i['number_1099-div'])])
+            total = box_total(i, v, '1099-div', 'box_1b')
             if total > 0.0 and i['qualified_dividends_incorrect']:
                 self.not_implemented()
             return total if i['number_1099-div'] > 0 else None
 
         def line_3b(self, i, v):
             """ordinary dividends"""
-            total = sum([v[f'1099-div:{n}.box_1a'] for n in range(i['number_1099-div'])])
+            total = box_total(i, v, '1099-div', 'box_1a')
             if total > self.threshold('sched_b_required_dividends'):
                 return v['1040_sb.6'] # Schedule B
             elif i['ordinary_dividends_incorrect']:
                 self.not_implemented()
             return total if i['number_1099-div'] > 0 else None
 
+        @memoized
         def line_4a_4b(self, i, v):
             line_4a = 0.0
             line_4b = 0.0
 
-            ira_distributions_you = sum([v[f'1099-r:{n}.box_1'] if v[f'1099-r:{n}.box_7_ira_sep_simple'] and v[f'1099-r:{n}.belongs_to'] == enum.taxpayer_or_spouse.taxpayer else 0.0 for n in range(i['number_1099-r'])])
-            ira_distributions_spouse = sum([v[f'1099-r:{n}.box_1'] if v[f'1099-r:{n}.box_7_ira_sep_simple'] and v[f'1099-r:{n}.belongs_to'] == enum.taxpayer_or_spouse.spouse else 0.0 for n in range(i['number_1099-r'])])
+            ira_distributions_you = v['ira_distributions_you']
+            ira_distributions_spouse = v['ira_distributions_spouse']
 
             if ira_distributions_you > 0.001:
-                if sum([i['ira_exception1_you'], i['ira_exception2_you'], i['ira_exception3_you'], i['ira_exception4_you']]) > 1:
+                exception1, exception2, exception3, exception4 = i['ira_exception1_you'], i['ira_exception2_you'], i['ira_exception3_you'], i['ira_exception4_you']
+                if exception1 + exception2 + exception3 + exception4 > 1:
                     self.not_implemented()
-                if i['ira_exception1_you']:
+                if exception1:
                     if not i['ira_exception1_you_total']:
                         self.not_implemented()
                     line_4a += ira_distributions_you
-                elif i['ira_exception2_you']:
+                elif exception2:
                     line_4a += ira_distributions_you
                     line_4b += v['8606:you.taxable_amount']
-                elif i['ira_exception3_you']:
+                elif exception3:
                     if not i['ira_exception3_you_total'] or ira_distributions_you > 1000000:
                         self.not_implemented()
                     line_4a += ira_distributions_you
-                elif i['ira_exception4_you']:
+                elif exception4:
                     self.not_implemented()
                 else:
                     line_4b += ira_distributions_you
 
             if ira_distributions_spouse > 0.001:
-                if sum([i['ira_exception1_spouse'], i['ira_exception2_spouse'], i['ira_exception3_spouse'], i['ira_exception4_spouse']]) > 1:
+                exception1, exception2, exception3, exception4 = i['ira_exception1_spouse'], i['ira_exception2_spouse'], i['ira_exception3_spouse'], i['ira_exception4_spouse']
+                if exception1 + exception2 + exception3 + exception4 > 1:
                     self.not_implemented()
-                if i['ira_exception1_spouse']:
+                if exception1:
                     if not i['ira_exception1_spouse_total']:
                         self.not_implemented()
                     line_4a += ira_distributions_spouse
-                elif i['ira_exception2_spouse']:
+                elif exception2:
                     line_4a += ira_distributions_spouse
                     line_4b += v['8606:spouse.taxable_amount']
-                elif i['ira_exception3_spouse']:
+                elif exception3:
                     if not i['ira_exception3_spouse_total'] or ira_distributions_spouse > 1000000:
                         self.not_implemented()
                     line_4a += ira_distributions_spouse
-                elif i['ira_exception4_spouse']:
+                elif exception4:
                     self.not_implemented()
                 else:
                     line_4b += ira_distributions_spouse
 
             return (line_4a, line_4b) if ira_distributions_you + ira_distributions_spouse > 0.001 else (None, None)
 
+        @memoized
         def line_5a_5b(self, i, v):
             if i['pensions_annuities_adjustments']:
                 self.not_implemented()
 
-            distributions = 0.0
-            taxable_amount = 0.0
-            for n in range(i['number_1099-r']):
-                if not v[f'1099-r:{n}.box_7_ira_sep_simple']:
-                    if v[f'1099-r:{n}.box_2b_taxable_not_determined']:
-                        self.not_implemented()
-                    distributions += v[f'1099-r:{n}.box_1']
-                    taxable_amount += v[f'1099-r:{n}.box_2a']
+            _, _, distributions, taxable_amount, not_determined = scan_1099_r(i, v)
+            if not_determined:
+                self.not_implemented()
             return (distributions, taxable_amount) if distributions + taxable_amount > 0.001 else (None, None)
 
         def schedule_1_additional_income(self, i, v):
-            mort_int_refund = sum([v[f'1098:{n}.box_4'] for n in range(i['number_1098'])])
-            state_income_refund = sum([v[f'1099-g:{n}.box_2'] for n in range(i['number_1099-g'])])
-            return (mort_int_refund + state_income_refund) > 0.001 or i['schedule_1_additional_income']
-
-        def standard_deduction(self, i):
-            return self.threshold('standard_deduction', i['filing_status'])
+            if i['schedule_1_additional_income']:
+                return True
+            mort_int_refund = box_total(i, v, '1098', 'box_4')
+            state_income_refund = box_total(i, v, '1099-g', 'box_2')
+            return (mort_int_refund + state_income_refund) > 0.001
 
         def line_12(self, i, v):
             if v['itemizing']:
@@ -278,10 +516,10 @@ class Form1040(Form):
             elif i['standard_deduction_exceptions']:
                 self.not_implemented()
             else:
-                return standard_deduction(self, i)
+                return v['standard_deduction']
 
         def line_13(self, i, v):
-            section_199a = sum([v[f'1099-div:{n}.box_5'] for n in range(i['number_1099-div'])])
+            section_199a = box_total(i, v, '1099-div', 'box_5')
 
             income_limit = self.threshold('form_8995_required', i['filing_status'])
 
@@ -291,6 +529,10 @@ class Form1040(Form):
                 return v['8995.15']
             return None
 
+        def line_15(self, i, v):
+            taxable_income = v['11'] - v['14']
+            return taxable_income if taxable_income > 0.0 else 0.0
+
         def line_16(self, i, v):
             if i['uncommon_tax'] or i['need_8615'] or i['schedule_d_required']:
                 self.not_implemented()
@@ -304,15 +546,23 @@ class Form1040(Form):
             else:
                 return None
 
+        def line_22(self, i, v):
+            tax_less_credits = v['18'] - v['21']
+            return tax_less_credits if tax_less_credits > 0.0 else 0.0
+
         def need_schedule_3_part_i(self, i, v):
-            foreign_tax = float(sum([v[f'1099-int:{n}.box_6'] for n in range(i['number_1099-int'])]))
-            foreign_tax += float(sum([v[f'1099-div:{n}.box_7'] for n in range(i['number_1099-div'])]))
-            return foreign_tax > 0.001 or i['need_schedule_3_part_i']
+            if i['need_schedule_3_part_i']:
+                return True
+            foreign_tax = box_total(i, v, '1099-int', 'box_6')
+            foreign_tax += box_total(i, v, '1099-div', 'box_7')
+            return foreign_tax > 0.001
 
         def line_25b(self, i, v):
-            withholding = float(sum([v[f'1099-r:{n}.box_4'] for n in range(i['number_1099-r'])]))
-            withholding += float(sum([v[f'1099-div:{n}.box_4'] for n in range(i['number_1099-div'])]))
-            withholding += float(sum([v[f'1099-int:{n}.box_4'] for n in range(i['number_1099-int'])]))
+            if i['number_1099-r'] + i['number_1099-div'] + i['number_1099-int'] == 0:
+                return None
+            withholding = box_total(i, v, '1099-r', 'box_4')
+            withholding += box_total(i, v, '1099-div', 'box_4')
+            withholding += box_total(i, v, '1099-int', 'box_4')
             if withholding > 0.001:
                 return withholding
             return None
@@ -331,14 +581,13 @@ class Form1040(Form):
                 return None
 
         def form_8959_required(self, i, v):
-            for n in range(i['number_w-2']):
-                if v[f'w-2:{n}.box_5'] > self.threshold('additional_medicare_tax_withheld'):
-                    return True
+            medicare_wages_tips = boxes(i, v, 'w-2', 'box_5')
+            withheld_threshold = self.threshold('additional_medicare_tax_withheld')
+            if any(wages > withheld_threshold for wages in medicare_wages_tips):
+                return True
             threshold = self.threshold('additional_medicare_tax_applies', i['filing_status'])
 
-            medicare_wages_tips = float(sum([v[f'w-2:{n}.box_5'] for n in range(i['number_w-2'])]))
-
-            if medicare_wages_tips > threshold:
+            if box_total(i, v, 'w-2', 'box_5') > threshold:
                 return True
 
             if i['rrta_compensation'] or i['self_employment_income']:
@@ -347,7 +596,7 @@ class Form1040(Form):
 
         def possible_eic(self, i, v):
             dependents = min(3, i['number_dependents'])
-            eic_income_limit = self.threshold(f'eic_disallowed_{dependents}_dependents', i['filing_status'])
+            eic_income_limit = self.threshold(EIC_DISALLOWED_THRESHOLDS[dependents], i['filing_status'])
             if v['11'] >= eic_income_limit:
                 return False
 
@@ -359,7 +608,7 @@ class Form1040(Form):
         def line_38(self, i, v):
             tax_shown = v['24'] - sum([v['27'], v['28'], v['29']])
             if i['need_schedule_3_part_ii']:
-                tax_shown -= sum([v[f'1040_s3.{l}'] for l in ['9', '12', '13b', '13h']])
+                tax_shown -= sum(v[f'1040_s3.{l}'] for l in ['9', '12', '13b', '13h'])
             if v['37'] >= self.threshold('tax_penalty_dollars') and v['37'] > (self.threshold('tax_penalty_pct') * tax_shown):
                 return i['tax_penalty']
             return None
@@ -369,9 +618,9 @@ class Form1040(Form):
             StringField('first_name', lambda s, i, v: f'{i["first_name"]} {i["middle_initial"]}'.strip()),
             StringField('last_name', lambda s, i, v: i['last_name']),
             StringField('you_ssn', lambda s, i, v: i['you_ssn']),
-            StringField('spouse_first_name', lambda s, i, v: f'{i["spouse_first_name"]} {i["spouse_middle_initial"]}'.strip() if i['filing_status'] == status.MarriedFilingJointly else None),
-            StringField('spouse_last_name', lambda s, i, v: i['spouse_last_name'] if i['filing_status'] == status.MarriedFilingJointly else None),
-            StringField('spouse_ssn', lambda s, i, v: i['spouse_ssn'] if i['filing_status'] == status.MarriedFilingJointly else None),
+            StringField('spouse_first_name', lambda s, i, v: f'{i["spouse_first_name"]} {i["spouse_middle_initial"]}'.strip() if v['married_filing_jointly'] else None),
+            StringField('spouse_last_name', lambda s, i, v: i['spouse_last_name'] if v['married_filing_jointly'] else None),
+            StringField('spouse_ssn', lambda s, i, v: i['spouse_ssn'] if v['married_filing_jointly'] else None),
             StringField('full_names', full_names),
             StringField('home_address', lambda s, i, v: i['home_address']),
             StringField('apartment_no', lambda s, i, v: i['apartment_no']),
@@ -382,7 +631,7 @@ class Form1040(Form):
             StringField('foreign_province', lambda s, i, v: i['foreign_province']),
             StringField('foreign_postal_code', lambda s, i, v: i['foreign_postal_code']),
             BooleanField('you_presidential_election', lambda s, i, v: i['you_presidential_election']),
-            BooleanField('spouse_presidential_election', lambda s, i, v: i['spouse_presidential_election'] if i['filing_status'] == status.MarriedFilingJointly else False),
+            BooleanField('spouse_presidential_election', lambda s, i, v: i['spouse_presidential_election'] if v['married_filing_jointly'] else False),
             BooleanField('digital_assets', lambda s, i, v: s.not_implemented() if i['digital_assets'] else False),
             FloatField('1a', line_1a),
             FloatField('1b', lambda s, i, v: i['non_w-2_household_employee_income'] if i['non_w-2_household_employee_income'] > 0 else None),
@@ -393,8 +642,8 @@ class Form1040(Form):
             FloatField('1g', lambda s, i, v: s.not_implemented() if i['form_8919_required'] else None),
             FloatField('1h', lambda s, i, v: i['other_earned_income'] if i['other_earned_income'] > 0 else None),
             FloatField('1i', lambda s, i, v: s.not_implemented() if i['nontaxable_combat_pay'] else None),
-            FloatField('1z', lambda s, i, v: v['1a'] + v['1b'] + v['1c'] + v['1d'] + v['1e'] + v['1f'] + v['1g'] + v['1h'] + v['1i']),
-            FloatField('2a', lambda s, i, v: float(sum([v[f'1099-int:{n}.box_8'] for n in range(i['number_1099-int'])]))),
+            FloatField('1z', lambda s, i, v: sum(v.getmany(TOTALED_LINES['1z']))),
+            FloatField('2a', lambda s, i, v: box_total(i, v, '1099-int', 'box_8')),
             FloatField('2b', line_2b),
             FloatField('3a', line_3a),
             FloatField('3b', line_3b),
@@ -406,40 +655,40 @@ class Form1040(Form):
             FloatField('6b', lambda s, i, v: s.not_implemented() if i['social_security_benefits'] else None),
             BooleanField('6c', lambda s, i, v: s.not_implemented() if i['social_security_benefits'] else None),
             BooleanField('7_checkbox', lambda s, i, v: not i['schedule_d_required']),
-            FloatField('7', lambda s, i, v: s.not_implemented() if i['schedule_d_required'] or i['form_8949_required'] else float(sum([v[f'1099-div:{n}.box_2a'] for n in range(i['number_1099-div'])]))),
+            FloatField('7', lambda s, i, v: s.not_implemented() if i['schedule_d_required'] or i['form_8949_required'] else box_total(i, v, '1099-div', 'box_2a')),
             BooleanField('schedule_1_additional_income', lambda s, i, v: schedule_1_additional_income(s, i, v)),
             FloatField('8', lambda s, i, v: v['1040_s1.10'] if v['schedule_1_additional_income'] else None),
-            FloatField('9', lambda s, i, v: v['1z'] + v['2b'] + v['3b'] + v['4b'] + v['5b'] + v['6b'] + v['7'] + v['8']),
+            FloatField('9', lambda s, i, v: sum(v.getmany(TOTALED_LINES['9']))),
             FloatField('10', lambda s, i, v: v['1040_s1.26'] if i['schedule_1_income_adjustments'] else None),
             FloatField('11', lambda s, i, v: v['9'] - v['10']), # AGI
-            BooleanField('itemizing', lambda s, i, v: i['itemize'] and (v['1040_sa.17'] >= standard_deduction(s, i) or i['1040_sa.itemize_though_less'])),
+            BooleanField('itemizing', lambda s, i, v: i['itemize'] and (v['1040_sa.17'] >= v['standard_deduction'] or i['1040_sa.itemize_though_less'])),
             FloatField('12', line_12),
             FloatField('13', line_13),
-            FloatField('14', lambda s, i, v: v['12'] + v['13']),
-            FloatField('15', lambda s, i, v: max(0.0, v['11'] - v['14'])), # Taxable income
+            FloatField('14', lambda s, i, v: sum(v.getmany(TOTALED_LINES['14']))),
+            FloatField('15', line_15), # Taxable income
             FloatField('16', line_16), # Tax
             BooleanField('schedule_2_part_i_needed', lambda s, i, v: i['need_8962'] or v['1040_s2_need_6251.need_6251']),
             FloatField('17', lambda s, i, v: v['1040_s2.3'] if v['schedule_2_part_i_needed'] else None),
-            FloatField('18', lambda s, i, v: v['16'] + v['17']),
+            FloatField('18', lambda s, i, v: sum(v.getmany(TOTALED_LINES['18']))),
             FloatField('19', line_19),
             BooleanField('need_schedule_3_part_i', need_schedule_3_part_i),
             FloatField('20', lambda s, i, v: v['1040_s3.8'] if v['need_schedule_3_part_i'] else None),
-            FloatField('21', lambda s, i, v: v['19'] + v['20']),
-            FloatField('22', lambda s, i, v: max(0.0, v['18'] - v['21'])),
+            FloatField('21', lambda s, i, v: sum(v.getmany(TOTALED_LINES['21']))),
+            FloatField('22', line_22),
             FloatField('23', lambda s, i, v: s.not_implemented() if i['need_schedule_2'] else None),
-            FloatField('24', lambda s, i, v: v['22'] + v['23']),
-            FloatField('25a', lambda s, i, v: sum([v[f'w-2:{n}.box_2'] for n in range(i['number_w-2'])]) if i['number_w-2'] > 0 else None),
+            FloatField('24', lambda s, i, v: sum(v.getmany(TOTALED_LINES['24']))),
+            FloatField('25a', lambda s, i, v: box_total(i, v, 'w-2', 'box_2') if i['number_w-2'] > 0 else None),
             FloatField('25b', line_25b),
             FloatField('25c', line_25c),
-            FloatField('25d', lambda s, i, v: v['25a'] + v['25b'] + v['25c']),
+            FloatField('25d', lambda s, i, v: sum(v.getmany(TOTALED_LINES['25d']))),
             FloatField('26', lambda s, i, v: i['estimated_tax_payments']),
             FloatField('27', lambda s, i, v: s.not_implemented("You may be able to claim the Earned Income Credit, but it is not implemented") if possible_eic(s, i, v) else None),
             FloatField('28', line_28),
             FloatField('29', lambda s, i, v: s.not_implemented("Form 8863 not implemented") if i['postsecondary_education_expenses'] else None),
             FloatField('30', lambda s, i, v: None), #Reserved for future use
             FloatField('31', lambda s, i, v: s.not_implemented() if i['need_schedule_3_part_ii'] else None),
-            FloatField('32', lambda s, i, v: v['27'] + v['28'] + v['29'] + v['31']),
-            FloatField('33', lambda s, i, v: v['25d'] + v['26'] + v['32']),
+            FloatField('32', lambda s, i, v: sum(v.getmany(TOTALED_LINES['32']))),
+            FloatField('33', lambda s, i, v: sum(v.getmany(TOTALED_LINES['33']))),
             FloatField('34', lambda s, i, v: (v['33'] - v['24']) if v['33'] > v['24'] else None),
             FloatField('35a', lambda s, i, v: v['34'] - v['36'] if v['34'] > 0.001 else None),
             StringField('35b', lambda s, i, v: i['routing_number'] if v['35a'] > 0.001 else None),
@@ -450,165 +699,34 @@ class Form1040(Form):
             FloatField('38', line_38),
             BooleanField('designee', lambda s, i, v: False),
             StringField('occupation', lambda s, i, v: i['occupation']),
-            StringField('spouse_occupation', lambda s, i, v: i['spouse_occupation'] if i['filing_status'] == status.MarriedFilingJointly else ""),
+            StringField('spouse_occupation', lambda s, i, v: i['spouse_occupation'] if v['married_filing_jointly'] else ""),
             StringField('phone_number', lambda s, i, v: i['phone_number']),
             StringField('email_address', lambda s, i, v: i['email_address']),
         ]
+        # The names are formatted here, once, and bound to each lambda as
+        # defaults, rather than being formatted each time a field is solved
         for n in range(4):
+            name, ssn, relationship, ctc, odc = (f'dependent_{n}_{x}' for x in ('name', 'ssn', 'relationship', 'ctc', 'odc'))
             required_fields += [
-                StringField(f'dependent_{n}_name', lambda s, i, v, n=n: i[f'dependent_{n}_name'] if n < i['number_dependents'] else None),
-                StringField(f'dependent_{n}_ssn', lambda s, i, v, n=n: i[f'dependent_{n}_ssn'] if n < i['number_dependents'] else None),
-                StringField(f'dependent_{n}_relationship', lambda s, i, v, n=n: i[f'dependent_{n}_relationship'] if n < i['number_dependents'] else None),
-                BooleanField(f'dependent_{n}_ctc', lambda s, i, v, n=n: i[f'dependent_{n}_ctc'] if n < i['number_dependents'] else None),
-                BooleanField(f'dependent_{n}_odc', lambda s, i, v, n=n: i[f'dependent_{n}_odc'] if n < i['number_dependents'] and not v[f'dependent_{n}_ctc'] else None),
+                StringField(name, lambda s, i, v, n=n, k=name: i[k] if n < i['number_dependents'] else None),
+                StringField(ssn, lambda s, i, v, n=n, k=ssn: i[k] if n < i['number_dependents'] else None),
+                StringField(relationship, lambda s, i, v, n=n, k=relationship: i[k] if n < i['number_dependents'] else None),
+                BooleanField(ctc, lambda s, i, v, n=n, k=ctc: i[k] if n < i['number_dependents'] else None),
+                BooleanField(odc, lambda s, i, v, n=n, k=odc, ctc=ctc: i[k] if n < i['number_dependents'] and not v[ctc] else None),
             ]
 
-        pdf_fields = [
-#            TextPDFField('topmostSubform[0].Page1[0].f1_01[0]', 'tax_year_begin_month'),
-#            TextPDFField('topmostSubform[0].Page1[0].f1_02[0]', 'tax_year_end_month'),
-#            TextPDFField('topmostSubform[0].Page1[0].f1_03[0]', 'tax_year_20xx', max_length=2),
-            TextPDFField('topmostSubform[0].Page1[0].f1_04[0]', 'first_name'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_05[0]', 'last_name'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_06[0]', 'you_ssn', max_length=9),
-            TextPDFField('topmostSubform[0].Page1[0].f1_07[0]', 'spouse_first_name'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_08[0]', 'spouse_last_name'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_09[0]', 'spouse_ssn', max_length=9),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_10[0]', 'home_address'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_11[0]', 'apartment_no'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_12[0]', 'city'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_13[0]', 'state'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_14[0]', 'zip'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_15[0]', 'foreign_country'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_16[0]', 'foreign_province'),
-            TextPDFField('topmostSubform[0].Page1[0].Address_ReadOrder[0].f1_17[0]', 'foreign_postal_code'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_1[0]', 'you_presidential_election', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_2[0]', 'spouse_presidential_election', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[0]', 'filing_status', '1', value_fn=lambda s, v, f: v == f.enum().Single),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[1]', 'filing_status', '2', value_fn=lambda s, v, f: v == f.enum().HeadOfHousehold),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[2]', 'filing_status', '3', value_fn=lambda s, v, f: v == f.enum().MarriedFilingJointly),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[3]', 'filing_status', '4', value_fn=lambda s, v, f: v == f.enum().MarriedFilingSeparately),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[4]', 'filing_status', '5', value_fn=lambda s, v, f: v == f.enum().QualifyingSurvivingSpouse),
-#            TextPDFField('topmostSubform[0].Page1[0].f1_18[0]', 'additional_name'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_4[0]', 'digital_assets', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_4[1]', 'digital_assets', '2', value_fn=lambda s, v, f: not v),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_5[0]', 'you_as_dependent', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_6[0]', 'spouse_as_dependent', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_7[0]', 'spouse_itemize_or_alien', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_8[0]', 'old', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_9[0]', 'blind', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_10[0]', 'spouse_old', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].c1_11[0]', 'spouse_blind', '1'),
-#            ButtonPDFField('topmostSubform[0].Page1[0].Dependents_ReadOrder[0].c1_12[0]', 'more_than_4_dependents', '1'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].f1_19[0]', 'dependent_0_name'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].f1_20[0]', 'dependent_0_ssn', max_length=9),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].f1_21[0]', 'dependent_0_relationship'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].c1_13[0]', 'dependent_0_ctc', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row1[0].c1_14[0]', 'dependent_0_odc', '1'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].f1_22[0]', 'dependent_1_name'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].f1_23[0]', 'dependent_1_ssn', max_length=9),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].f1_24[0]', 'dependent_1_relationship'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].c1_15[0]', 'dependent_1_ctc', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row2[0].c1_16[0]', 'dependent_1_odc', '1'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].f1_25[0]', 'dependent_2_name'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].f1_26[0]', 'dependent_2_ssn', max_length=9),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].f1_27[0]', 'dependent_2_relationship'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].c1_17[0]', 'dependent_2_ctc', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row3[0].c1_18[0]', 'dependent_2_odc', '1'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].f1_28[0]', 'dependent_3_name'),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].f1_29[0]', 'dependent_3_ssn', max_length=9),
-            TextPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].f1_30[0]', 'dependent_3_relationship'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].c1_19[0]', 'dependent_3_ctc', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Table_Dependents[0].Row4[0].c1_20[0]', 'dependent_3_odc', '1'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_31[0]', '1a'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_32[0]', '1b'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_33[0]', '1c'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_34[0]', '1d'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_35[0]', '1e'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_36[0]', '1f'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_37[0]', '1g'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_38[0]', '1h'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_39[0]', '1i'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_40[0]', '1z'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_41[0]', '2a'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_42[0]', '2b'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_43[0]', '3a'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_44[0]', '3b'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_45[0]', '4a'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_46[0]', '4b'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_47[0]', '5a'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_48[0]', '5b'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_49[0]', '6a'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_50[0]', '6b'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].c1_21[0]', '6c', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].c1_22[0]', '7_checkbox', '1'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_51[0]', '7'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_52[0]', '8'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_53[0]', '9'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_54[0]', '10'),
-            TextPDFField('topmostSubform[0].Page1[0].Line4a-11_ReadOrder[0].f1_55[0]', '11'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_56[0]', '12'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_57[0]', '13'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_58[0]', '14'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_59[0]', '15'),
-#            ButtonPDFField('topmostSubform[0].Page2[0].c2_1[0]', '8814_tax', '1'),
-#            ButtonPDFField('topmostSubform[0].Page2[0].c2_2[0]', '4974_tax', '1'),
-#            ButtonPDFField('topmostSubform[0].Page2[0].c2_3[0]', 'other_tax', '1'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_01[0]', 'other_tax_description'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_02[0]', '16'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_03[0]', '17'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_04[0]', '18'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_05[0]', '19'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_06[0]', '20'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_07[0]', '21'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_08[0]', '22'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_09[0]', '23'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_10[0]', '24'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_11[0]', '25a'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_12[0]', '25b'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_13[0]', '25c'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_14[0]', '25d'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_15[0]', '26'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_16[0]', '27'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_17[0]', '28'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_18[0]', '29'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_19[0]', 'reserved'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_20[0]', '31'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_21[0]', '32'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_22[0]', '33'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_23[0]', '34'),
-#            ButtonPDFField('topmostSubform[0].Page2[0].c2_4[0]', 'form_8888', '1'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_24[0]', '35a'),
-            TextPDFField('topmostSubform[0].Page2[0].RoutingNo[0].f2_25[0]', '35b', max_length=9),
-            ButtonPDFField('topmostSubform[0].Page2[0].c2_5[0]', '35c', '1'),
-            ButtonPDFField('topmostSubform[0].Page2[0].c2_5[1]', '35c', '2', value_fn=lambda s, v, f: not v),
-            TextPDFField('topmostSubform[0].Page2[0].AccountNo[0].f2_26[0]', '35d', max_length=17),
-            TextPDFField('topmostSubform[0].Page2[0].f2_27[0]', '36'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_28[0]', '37'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_29[0]', '38'),
-            ButtonPDFField('topmostSubform[0].Page2[0].c2_6[0]', 'designee', '1'),
-            ButtonPDFField('topmostSubform[0].Page2[0].c2_6[1]', 'designee', '2', value_fn=lambda s, v, f: not v),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_30[0]', 'designee_name'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_31[0]', 'designee_phone'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_32[0]', 'designee_pin', max_length=5),
-            TextPDFField('topmostSubform[0].Page2[0].f2_33[0]', 'occupation'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_34[0]', 'you_pin', max_length=6),
-            TextPDFField('topmostSubform[0].Page2[0].f2_35[0]', 'spouse_occupation'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_36[0]', 'spouse_pin', max_length=6),
-            TextPDFField('topmostSubform[0].Page2[0].f2_37[0]', 'phone_number'),
-            TextPDFField('topmostSubform[0].Page2[0].f2_38[0]', 'email_address'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_39[0]', 'preparer_name'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_40[0]', 'ptin', max_length=11),
-#            ButtonPDFField('topmostSubform[0].Page2[0].c2_7[0]', 'preparer_self-employed', '1'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_41[0]', 'preparer_firm'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_42[0]', 'preparer_ph'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_43[0]', 'preparer_firm'),
-#            TextPDFField('topmostSubform[0].Page2[0].f2_44[0]', 'prep_ein', max_length=10),
+        # Intermediate values which are only solved when another field needs
+        # them, and which are then shared with any other fields that do
+        optional_fields = [
+            FloatField('ira_distributions_you', lambda s, i, v: scan_1099_r(i, v)[0]),
+            FloatField('ira_distributions_spouse', lambda s, i, v: scan_1099_r(i, v)[1]),
+            FloatField('standard_deduction', lambda s, i, v: s.threshold('standard_deduction', i['filing_status'])),
+            BooleanField('married_filing_jointly', lambda s, i, v: i['filing_status'] is status.MarriedFilingJointly),
         ]
-        pdf_file = os.path.join(os.path.dirname(__file__), 'f1040.pdf')
 
-        super().__init__(__class__, inputs, required_fields, [],
-                         thresholds=thresholds, pdf_fields=pdf_fields,
-                         pdf_file=pdf_file, **kwargs)
+        super().__init__(__class__, inputs, required_fields, optional_fields,
+                         thresholds=THRESHOLDS, pdf_fields=PDF_FIELDS,
+                         pdf_file=PDF_FILE, **kwargs)
 
     def needs_filing(self, values):
         return True
@@ -1,3 +1,8 @@
+from bisect import bisect_right
+from functools import lru_cache
+
+from habutax.enum import filing_status as status
+
 TAX_TABLE = (
     # income min (inclusive), income max (exclusive), single, married filing jointly/qualifying surviving spouse, married filing separately, head of household
     (0, 5, 0, 0, 0, 0),
@@ -2100,10 +2105,25 @@ TAX_WORKSHEET_VALUES = (
 )
 
 
+# Column of TAX_TABLE holding the tax for each filing status (2 greater than
+# the index of that filing status' TAX_WORKSHEET_VALUES)
+FILING_STATUS_COLUMNS = {
+    status.Single: 2,
+    status.MarriedFilingJointly: 3,
+    status.QualifyingSurvivingSpouse: 3,
+    status.MarriedFilingSeparately: 4,
+    status.HeadOfHousehold: 5,
+}
+
+# Lower bound of each row of TAX_TABLE, used to binary search for the row
+# containing a taxable amount
+TAX_TABLE_MINIMUMS = tuple(row[0] for row in TAX_TABLE)
+
+
 def figure_tax_table(taxable_amount, filing_status_column):
-    for row in TAX_TABLE:
-        if taxable_amount >= row[0] and taxable_amount < row[1]:
-            return float(row[filing_status_column])
+    row = TAX_TABLE[bisect_right(TAX_TABLE_MINIMUMS, taxable_amount) - 1]
+    if taxable_amount >= row[0] and taxable_amount < row[1]:
+        return float(row[filing_status_column])
 
     # If we got here, something went wrong
     assert False, f"Failed to find a matching entry for {taxable_amount} in the tax table"
@@ -2123,16 +2143,12 @@ def figure_tax_worksheet(taxable_amount, filing_status_index):
     assert False, f"Failed to find a matching entry for {taxable_amount} in the tax worksheet"
 
 
+# Tax is figured for the same taxable amounts several times while solving (Form
+# 1040 line 16 and the Qualified Dividends and Capital Gain Tax Worksheet), and
+# the result only depends on the arguments
+@lru_cache(maxsize=4096)
 def figure_tax(taxable_amount, filing_status):
-    filing_status_index = None
-    if filing_status is filing_status.Single:
-        filing_status_index = 2
-    elif filing_status in [filing_status.MarriedFilingJointly, filing_status.QualifyingSurvivingSpouse]:
-        filing_status_index = 3
-    elif filing_status is filing_status.MarriedFilingSeparately:
-        filing_status_index = 4
-    elif filing_status is filing_status.HeadOfHousehold:
-        filing_status_index = 5
+    filing_status_index = FILING_STATUS_COLUMNS[filing_status]
 
     if taxable_amount < 100000:
         return figure_tax_table(taxable_amount, filing_status_index)
@@ -1,12 +1,54 @@
 import os
 
-from habutax.form import Form, Jurisdiction
+from habutax.form import Form, Jurisdiction, instance_field_names
 from habutax.inputs import *
 from habutax.fields import *
 from habutax.pdf_fields import *
 import habutax.enum as enum
 
 
+# Schedule C has room for this many 1099-INT and 1099-DIV payers
+NUM_FIELDS = 14
+
+# The boxes of each kind of 1099 which are totaled for its amount on line 1 or 5
+AMOUNT_BOXES = {
+    '1099-int': ('box_1', 'box_3'),
+    '1099-div': ('box_1a',),
+}
+
+# Shared between Form1040SC instances (see PDFField)
+PDF_FIELDS = (
+    TextPDFField('topmostSubform[0].Page1[0].f1_01[0]', '1040.full_names'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_02[0]', '1040.you_ssn', max_length=11),
+    TextPDFField('topmostSubform[0].Page1[0].Line1_ReadOrder[0].f1_03[0]', '1_payer_0'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_04[0]', '1_amount_0'),
+    # Remaining input fields for field 1 are below in a 'for' loop
+    TextPDFField('topmostSubform[0].Page1[0].f1_31[0]', '2'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_32[0]', '3'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_33[0]', '4'),
+    TextPDFField('topmostSubform[0].Page1[0].ReadOrderControl[0].f1_34[0]', '5_payer_0'),
+    TextPDFField('topmostSubform[0].Page1[0].f1_35[0]', '5_amount_0'),
+    # Remaining input fields for field 5 are below in a 'for' loop
+    TextPDFField('topmostSubform[0].Page1[0].f1_64[0]', '6'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_1[0]', '7a', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_1[1]', '7a', '2', lambda s, v, f: not v),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_2[0]', '7b', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_2[1]', '7b', '2', lambda s, v, f: not v),
+    TextPDFField('topmostSubform[0].Page1[0].f1_65[0]', '7b_country'),
+#    TextPDFField('topmostSubform[0].Page1[0].f1_66[0]', '7b_country'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_3[0]', '8', '1'),
+    ButtonPDFField('topmostSubform[0].Page1[0].c1_3[1]', '8', '2', lambda s, v, f: not v),
+) + tuple(pdf_field for line in range(1, NUM_FIELDS) for pdf_field in (
+    # The first of each of these fields is handled above, because they require
+    # different "selectors"
+    TextPDFField(f'topmostSubform[0].Page1[0].f1_{3+line*2:02d}[0]', f'1_payer_{line}'),
+    TextPDFField(f'topmostSubform[0].Page1[0].f1_{4+line*2:02d}[0]', f'1_amount_{line}'),
+    TextPDFField(f'topmostSubform[0].Page1[0].f1_{34+line*2:02d}[0]', f'5_payer_{line}'),
+    TextPDFField(f'topmostSubform[0].Page1[0].f1_{35+line*2:02d}[0]', f'5_amount_{line}'),
+))
+PDF_FILE = os.path.join(os.path.dirname(__file__), 'f1040sb.pdf')
+
+
 class Form1040SC(Form):
     form_name = "1040_sc"
     tax_year = 2023
@@ -16,7 +58,6 @@ class Form1040SC(Form):
     sequence_no = 9
 
     def __init__(self, **kwargs):
-        NUM_FIELDS = 14
         inputs = [
             StringInput('proprietor_name', description="Enter the full name of the proprietor."),
             EnumInput('ssn_source', enum=enum.taxpayer_spouse_or_estate_trust, description="Is the proprietor you, your spouse, or an estate or trust?"),
@@ -38,10 +79,25 @@ class Form1040SC(Form):
         optional_fields = [
         ]
 
+        # The number of each kind of 1099, and the payer and amount of each, are
+        # read once per form and then shared by all of the 1099 fields below
+        cache = {}
+
+        def number_1099(i, form_name):
+            if form_name not in cache:
+                cache[form_name] = i[f'1040.number_{form_name}']
+            return cache[form_name]
+
+        # Enum members compared against by the fields below
+        taxpayer = enum.taxpayer_spouse_or_estate_trust.taxpayer
+        spouse = enum.taxpayer_spouse_or_estate_trust.spouse
+        other_accounting_method = enum.business_accounting_method.other
+
         def ssn(self, i, v):
-            if i["ssn_source"] == enum.taxpayer_spouse_or_estate_trust.taxpayer:
+            ssn_source = i["ssn_source"]
+            if ssn_source == taxpayer:
                 return v["1040.you_ssn"]
-            if i["ssn_source"] == enum.taxpayer_spouse_or_estate_trust.spouse:
+            if ssn_source == spouse:
                 return v["1040.spouse_ssn"]
             return self.not_implemented(detailed="Businesses owned by Estates and Trusts are not implemented.")
 
@@ -60,56 +116,33 @@ class Form1040SC(Form):
             StringField('e1', lambda s, i, v: i['e1']),
             StringField('e2', lambda s, i, v: i['e2']),
             EnumField('f', enum=enum.business_accounting_method, value_fn=f),
-            StringField('f_other', lambda s, i, v: i['f_other'] if i['f'] == enum.business_accounting_method.other else ""),
+            StringField('f_other', lambda s, i, v: i['f_other'] if i['f'] == other_accounting_method else ""),
             BooleanField('g', lambda s, i, v: i['g'] if i['g'] else s.not_implemented(detailed="Filers that did not 'materially participate' in the operation of this business during the tax year are not implemented.")),
         ]
 
+        def payer_rows(i, v, form_name):
+            """Return a list of (payer, amount) for each of the 1099s of type
+            `form_name` which fit on this form, read in a single pass and then
+            shared by all of that type's fields"""
+            key = (form_name, 'rows')
+            if key not in cache:
+                count = min(number_1099(i, form_name), NUM_FIELDS)
+                payers = instance_field_names(form_name, 'payer', count)
+                amounts = zip(*(instance_field_names(form_name, box, count) for box in AMOUNT_BOXES[form_name]))
+                cache[key] = [(v[payer], sum(v[box] for box in boxes)) for payer, boxes in zip(payers, amounts)]
+            return cache[key]
+
+        # The line number is bound to each lambda as a default, as the lambdas
+        # would otherwise all see the last line
         for line in range(NUM_FIELDS):
-            int_payer = StringField(f'1_payer_{line}', lambda s, i, v: v[f'1099-int:{s.which_1099int}.payer'] if s.which_1099int < i['1040.number_1099-int'] else None)
-            int_payer.which_1099int = line
-            int_amount = FloatField(f'1_amount_{line}', lambda s, i, v: v[f'1099-int:{s.which_1099int}.box_1'] + v[f'1099-int:{s.which_1099int}.box_3'] if s.which_1099int < i['1040.number_1099-int'] else None)
-            int_amount.which_1099int = line
-            div_payer = StringField(f'5_payer_{line}', lambda s, i, v: v[f'1099-div:{s.which_1099div}.payer'] if s.which_1099div < i['1040.number_1099-div'] else None)
-            div_payer.which_1099div = line
-            div_amount = FloatField(f'5_amount_{line}', lambda s, i, v: v[f'1099-div:{s.which_1099div}.box_1a'] if s.which_1099div < i['1040.number_1099-div'] else None)
-            div_amount.which_1099div = line
-
-            required_fields += [int_payer, int_amount, div_payer, div_amount]
-
-        pdf_fields = [
-            TextPDFField('topmostSubform[0].Page1[0].f1_01[0]', '1040.full_names'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_02[0]', '1040.you_ssn', max_length=11),
-            TextPDFField('topmostSubform[0].Page1[0].Line1_ReadOrder[0].f1_03[0]', '1_payer_0'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_04[0]', '1_amount_0'),
-            # Remaining input fields for field 1 are below in a 'for' loop
-            TextPDFField('topmostSubform[0].Page1[0].f1_31[0]', '2'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_32[0]', '3'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_33[0]', '4'),
-            TextPDFField('topmostSubform[0].Page1[0].ReadOrderControl[0].f1_34[0]', '5_payer_0'),
-            TextPDFField('topmostSubform[0].Page1[0].f1_35[0]', '5_amount_0'),
-            # Remaining input fields for field 5 are below in a 'for' loop
-            TextPDFField('topmostSubform[0].Page1[0].f1_64[0]', '6'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_1[0]', '7a', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_1[1]', '7a', '2', lambda s, v, f: not v),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_2[0]', '7b', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_2[1]', '7b', '2', lambda s, v, f: not v),
-            TextPDFField('topmostSubform[0].Page1[0].f1_65[0]', '7b_country'),
-#            TextPDFField('topmostSubform[0].Page1[0].f1_66[0]', '7b_country'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[0]', '8', '1'),
-            ButtonPDFField('topmostSubform[0].Page1[0].c1_3[1]', '8', '2', lambda s, v, f: not v),
-        ]
+            required_fields += [
+                StringField(f'1_payer_{line}', lambda s, i, v, n=line: payer_rows(i, v, '1099-int')[n][0] if n < number_1099(i, '1099-int') else None),
+                FloatField(f'1_amount_{line}', lambda s, i, v, n=line: payer_rows(i, v, '1099-int')[n][1] if n < number_1099(i, '1099-int') else None),
+                StringField(f'5_payer_{line}', lambda s, i, v, n=line: payer_rows(i, v, '1099-div')[n][0] if n < number_1099(i, '1099-div') else None),
+                FloatField(f'5_amount_{line}', lambda s, i, v, n=line: payer_rows(i, v, '1099-div')[n][1] if n < number_1099(i, '1099-div') else None),
+            ]
 
-        # The first of each of the fields in this loop is handled above,
-        # because they require different "selectors"
-        for line in range(1, NUM_FIELDS):
-            one_payer = TextPDFField(f'topmostSubform[0].Page1[0].f1_{3+line*2:02d}[0]', f'1_payer_{line}')
-            one_amt = TextPDFField(f'topmostSubform[0].Page1[0].f1_{4+line*2:02d}[0]', f'1_amount_{line}')
-            five_payer = TextPDFField(f'topmostSubform[0].Page1[0].f1_{34+line*2:02d}[0]', f'5_payer_{line}')
-            five_amt = TextPDFField(f'topmostSubform[0].Page1[0].f1_{35+line*2:02d}[0]', f'5_amount_{line}')
-            pdf_fields += [one_payer, one_amt, five_payer, five_amt]
-
-        pdf_file = os.path.join(os.path.dirname(__file__), 'f1040sb.pdf')
-        super().__init__(__class__, inputs, required_fields, optional_fields, pdf_fields=pdf_fields, pdf_file=pdf_file, **kwargs)
+        super().__init__(__class__, inputs, required_fields, optional_fields, pdf_fields=PDF_FIELDS, pdf_file=PDF_FILE, **kwargs)
 
     def needs_filing(self, values):
         return True
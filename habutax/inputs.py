@@ -3,6 +3,8 @@ import configparser
 import re
 
 class Input(object):
+    __slots__ = ('_name', '_description', '_form')
+
     def __init__(self, name, description=None):
         assert "." not in name
         self._name = name
@@ -39,6 +41,8 @@ class Input(object):
         return True
 
 class StringInput(Input):
+    __slots__ = ()
+
     def format_suggestion(self):
         return ''
 
@@ -46,6 +50,8 @@ class StringInput(Input):
         return string.strip()
 
 class BooleanInput(Input):
+    __slots__ = ()
+
     def format_suggestion(self):
         return 'Input one of y[es] or n[o]'
 
@@ -58,6 +64,8 @@ class BooleanInput(Input):
         raise ValueError(f'Invalid boolean value: {string}')
 
 class IntegerInput(Input):
+    __slots__ = ()
+
     def format_suggestion(self):
         return "Input must be an integer"
 
@@ -68,6 +76,8 @@ class IntegerInput(Input):
         return int(string)
 
 class FloatInput(Input):
+    __slots__ = ()
+
     def format_suggestion(self):
         return "Input must be a floating point number"
 
@@ -78,6 +88,8 @@ class FloatInput(Input):
         return float(string)
 
 class EnumInput(StringInput):
+    __slots__ = ('enum', 'allow_empty')
+
     def __init__(self, name, enum, allow_empty=False, description=None):
         """
         Create an instance to read/validate an input that can be one of a
@@ -122,6 +134,8 @@ class EnumInput(StringInput):
         return self.enum[string]
 
 class RegexInput(StringInput):
+    __slots__ = ('_regex_str', '_regex')
+
     def __init__(self, name, regex, description=""):
         self._regex_str = regex
         self._regex = re.compile(regex)
@@ -139,6 +153,8 @@ class RegexInput(StringInput):
         return bool(self._regex.match(v))
 
 class SSNInput(StringInput):
+    __slots__ = ()
+
     def value(self, string):
         v = super().value(string)
         return v.replace("-", "")
@@ -160,6 +176,8 @@ class SSNInput(StringInput):
         return True
 
 class NaicsInput(StringInput):
+    __slots__ = ()
+
     def value(self, string):
         v = super().value(string)
         return v[:6]  # keep first 6 characters
@@ -180,6 +198,23 @@ class NaicsInput(StringInput):
                 return False
         return True
 
+class RoutingNumberInput(StringInput):
+    __slots__ = ()
+
+    # Valid ABA routing numbers begin with 01-12, 21-32
+    _prefixes = frozenset(f'{n:02}' for n in [*range(1, 13), *range(21, 33)])
+
+    def format_suggestion(self):
+        return "Input should be a 9-digit routing number beginning with 01-12 or 21-32"
+
+    def valid(self, string):
+        try:
+            routing = self.value(string)
+        except ValueError:
+            return False
+
+        return len(routing) == 9 and routing.isascii() and routing.isdigit() and routing[:2] in self._prefixes
+
 class MissingInputSpecification(Exception):
     def __init__(self, input_name, message_fmt="Missing input specification for {input_name}"):
         self.input_name = input_name
@@ -208,6 +243,9 @@ class InputStore(MutableMapping):
             with open(input_config) as config_file:
                 self.config.read_file(config_file)
         self.input_specs = input_specs
+        # Inputs are read many more times than they are set, so keep the
+        # parsed value of each input read, until it is set or removed
+        self._parsed = {}
 
     def write(self, filename):
         with open(filename, 'w') as outfile:
@@ -215,11 +253,15 @@ class InputStore(MutableMapping):
 
     def update_input_spec(self, input_specs):
         self.input_specs = input_specs
+        self._parsed.clear()
 
     def provides(self, input_obj):
         return self.config.has_option(input_obj.section(), input_obj.base_name())
 
     def __getitem__(self, key):
+        if key in self._parsed:
+            return self._parsed[key]
+
         if key not in self.input_specs:
             raise MissingInputSpecification(key)
 
@@ -229,7 +271,9 @@ class InputStore(MutableMapping):
         string = self.config.get(i.section(), i.base_name())
         if not i.valid(string):
             raise InvalidInput(key, string)
-        return i.value(string)
+        value = i.value(string)
+        self._parsed[key] = value
+        return value
 
     def __setitem__(self, key, value):
         if key not in self.input_specs:
@@ -238,12 +282,14 @@ class InputStore(MutableMapping):
         if i.section() not in self.config.sections():
             self.config.add_section(i.section())
         self.config.set(i.section(), i.base_name(), value)
+        self._parsed.pop(key, None)
 
     def __contains__(self, key):
         section, base_name = key.split(".")
         return self.config.has_option(section, base_name)
 
     def __delitem__(self, key):
+        self._parsed.pop(key, None)
         section, base_name = key.split(".")
         self.config.remove_option(section, base_name)
         if len(self.config[section]) == 0:
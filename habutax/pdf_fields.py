@@ -17,6 +17,11 @@ class PDFInvalidChoiceValue(Exception):
         super().__init__(self.message)
 
 class PDFField(object):
+    """Describes how to write a solved field's value into a PDF field. Unlike
+    inputs and fields, PDF fields hold no per-form state, so a form class can
+    build its PDF fields once and share them between all of its instances"""
+    __slots__ = ('pdf_field_name', 'field_name', '_value_fn')
+
     def __init__(self, pdf_field_name, field_name, value_fn=None):
         self.pdf_field_name = pdf_field_name
         self.field_name = field_name
@@ -32,6 +37,8 @@ class PDFField(object):
             return field_obj.to_string(value)
 
 class TextPDFField(PDFField):
+    __slots__ = ('max_length',)
+
     def __init__(self, name, value, max_length=None, value_fn=None):
         self.max_length = max_length
         super().__init__(name, value, value_fn=value_fn)
@@ -43,19 +50,38 @@ class TextPDFField(PDFField):
         return value
 
 class ButtonPDFField(PDFField):
+    __slots__ = ('_true_value',)
+
     def __init__(self, name, value, true_value, value_fn=None):
         self._true_value = true_value # The value to return when this is true
         super().__init__(name, value, value_fn=value_fn)
 
+    def checked(self, value):
+        return bool(value)
+
     def value(self, value, field_obj):
         if self._value_fn is not None:
             value = self._value_fn(value, field_obj)
-        if value:
+        if self.checked(value):
             return self._true_value
         else:
             return 'Off'
 
+class EnumButtonPDFField(ButtonPDFField):
+    """A button which is checked when its field's value is one particular
+    member of the field's enum (i.e. one of several filing status buttons)"""
+    __slots__ = ('_member',)
+
+    def __init__(self, name, value, true_value, member, value_fn=None):
+        self._member = member
+        super().__init__(name, value, true_value, value_fn=value_fn)
+
+    def checked(self, value):
+        return value is self._member
+
 class OptionlessButtonPDFField(PDFField):
+    __slots__ = ()
+
     def __init__(self, name, value, value_fn=None):
         super().__init__(name, value, value_fn=value_fn)
 
@@ -64,6 +90,8 @@ class OptionlessButtonPDFField(PDFField):
         raise NotImplementedError()
 
 class ChoicePDFField(PDFField):
+    __slots__ = ('_choices',)
+
     def __init__(self, name, value, choices, value_fn=None):
         self._choices = choices
         super().__init__(name, value, value_fn=value_fn)
@@ -121,10 +121,9 @@ class PDFFiller(object):
         pdfs = []
         with tempfile.TemporaryDirectory() as tmpdirname:
             for form in filling_forms:
-                if form.needs_filing(self._values):
-                    pdf_filename = os.path.join(tmpdirname, f'{form.name()}.pdf')
-                    self._fill_form(form, pdf_filename)
-                    pdfs.append(pdf_filename)
+                pdf_filename = os.path.join(tmpdirname, f'{form.name()}.pdf')
+                self._fill_form(form, pdf_filename)
+                pdfs.append(pdf_filename)
 
             cmd = [self._pdftk]
             cmd.extend(pdfs)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from habutax import fields
 from habutax import form
 from habutax import inputs
@@ -99,17 +101,22 @@ def _sort_keys(key):
         else:
             keys.append((True, current))
 
-    return keys
+    return tuple(keys)
+
+# The same field and input names are sorted over and over while solving, so
+# only parse each name once
+@lru_cache(maxsize=None)
+def _name_sort_keys(name):
+    if '.' in name:
+        form, key = name.split('.')
+    else:
+        form, key = '', name
+    return (_sort_keys(form), _sort_keys(key))
 
 def sort_keys(key):
     if isinstance(key, fields.Field) or isinstance(key, inputs.Input):
         key = key.name()
-
-    if '.' in key:
-        form, key = key.split('.')
-    else:
-        form = ''
-    return (_sort_keys(form), _sort_keys(key))
+    return _name_sort_keys(key)
 
 class Solver(object):
     def __init__(self, input_config, form_list, prompt=None):
@@ -130,6 +137,7 @@ class Solver(object):
         # Current state of solver, including form instances, values calculated,
         # any unmet field/input dependencies
         self.forms = {}
+        self._input_only_forms = {}
         self._v = values.ValueStore()
         self._unattempted_fields = []
         self._unimplemented_fields = []
@@ -163,19 +171,27 @@ class Solver(object):
         if form_name not in self._form_map:
             raise NotImplementedError(f'Form {form_name} is not supported.')
 
-        new_form = self._form_map[form_name](solver=self, instance=form_instance)
+        # If this form was previously added in `input_only` mode, its inputs
+        # are already known, so reuse that instance rather than constructing
+        # (and re-adding the inputs of) another one
+        if (form_name, form_instance) in self._input_only_forms:
+            new_form = self._input_only_forms.pop((form_name, form_instance))
+        else:
+            new_form = self._form_map[form_name](solver=self, instance=form_instance)
 
-        # Add new inputs to our internal map of names to input objects, update
-        # the input mapper so it understands how to read these inputs
-        for i in new_form.inputs():
-            assert i not in self._input_map
-            self._input_map[i.name()] = i
-        self._i.update_input_spec(self._input_map)
+            # Add new inputs to our internal map of names to input objects,
+            # update the input mapper so it understands how to read these
+            # inputs
+            for i in new_form.inputs():
+                assert i.name() not in self._input_map
+                self._input_map[i.name()] = i
+            self._i.update_input_spec(self._input_map)
 
         # Don't add the form to our map of forms, any fields to our field map,
         # or any fields to the lists of unattempted fields, or fields we are
         # solving
         if input_only:
+            self._input_only_forms[(form_name, form_instance)] = new_form
             return
 
         self.forms[new_form.name()] = new_form
@@ -1,8 +1,11 @@
 import configparser
 import unittest
 
+from habutax.enum import filing_status as status
 from habutax.inputs import InputStore
 from habutax.fields import *
+from habutax.form import Form, FormAccessor, FrozenThresholds, flatten_thresholds
+from habutax.values import UnmetDependency, ValueStore
 from habutax.solver import Solver
 
 
@@ -107,3 +110,83 @@ class FormTestCase(unittest.TestCase):
         form, field = field.split('.')
         calculated = f.from_string(solution[form][field])
         self.assertEqual(calculated, expected)
+
+
+class ThresholdTestForm(Form):
+    form_name = "0000"
+    tax_year = 1970
+
+    def __init__(self, thresholds, **kwargs):
+        super().__init__(__class__, [], [], [], thresholds=thresholds, **kwargs)
+
+
+class ThresholdsTestCase(unittest.TestCase):
+    def test_flatten_tuple_keys(self):
+        flat = flatten_thresholds({
+            'by_status': {
+                (status.MarriedFilingJointly, status.QualifyingSurvivingSpouse): 2.0,
+                status.Single: 1.0,
+            },
+        })
+        self.assertEqual(flat['by_status'], {
+            status.MarriedFilingJointly: 2.0,
+            status.QualifyingSurvivingSpouse: 2.0,
+            status.Single: 1.0,
+        })
+
+        form = ThresholdTestForm({'by_status': {(status.Single, status.HeadOfHousehold): 3.0}})
+        self.assertEqual(form.threshold('by_status', status.Single), 3.0)
+        self.assertEqual(form.threshold('by_status', status.HeadOfHousehold), 3.0)
+        with self.assertRaises(AssertionError):
+            form.threshold('by_status', status.MarriedFilingSeparately)
+
+    def test_flatten_scalar(self):
+        flat = flatten_thresholds({'scalar': 1000.0})
+        self.assertEqual(flat, {'scalar': 1000.0})
+        self.assertEqual(ThresholdTestForm({'scalar': 1000.0}).threshold('scalar'), 1000.0)
+
+    def test_flatten_duplicate_key(self):
+        with self.assertRaises(AssertionError):
+            flatten_thresholds({
+                'by_status': {
+                    (status.Single, status.HeadOfHousehold): 1.0,
+                    status.Single: 2.0,
+                },
+            })
+
+    def test_frozen_thresholds_shared(self):
+        frozen = FrozenThresholds({'by_status': {status.Single: 1.0}})
+        self.assertIs(ThresholdTestForm(frozen)._thresholds, frozen)
+        self.assertIs(ThresholdTestForm(frozen)._thresholds, frozen)
+
+    def test_frozen_thresholds_read_only(self):
+        frozen = FrozenThresholds({'scalar': 1.0, 'by_status': {status.Single: 1.0}})
+        with self.assertRaises(TypeError):
+            frozen['scalar'] = 2.0
+        with self.assertRaises(TypeError):
+            frozen['by_status'][status.Single] = 2.0
+        self.assertEqual(ThresholdTestForm(frozen).threshold('by_status', status.Single), 1.0)
+
+
+class FormAccessorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.values = ValueStore({'0000.a': 1, '0000.b': 2, 'other.c': 3})
+        self.accessor = FormAccessor(self.values, ThresholdTestForm({}))
+
+    def test_getmany_order(self):
+        self.assertEqual(self.accessor.getmany(('b', 'a')), [2, 1])
+        self.assertEqual(self.accessor.getmany(('a', 'other.c', 'b')), [1, 3, 2])
+        self.assertEqual(self.accessor.getmany(('a', 'other.c', 'b')),
+                         [self.accessor[k] for k in ('a', 'other.c', 'b')])
+
+    def test_getmany_unmet_dependency(self):
+        with self.assertRaises(UnmetDependency) as getitem_cm:
+            self.accessor['missing']
+        with self.assertRaises(UnmetDependency) as getmany_cm:
+            self.accessor.getmany(('a', 'missing', 'other.missing'))
+        self.assertEqual(getmany_cm.exception.dependency, '0000.missing')
+        self.assertEqual(getmany_cm.exception.dependency, getitem_cm.exception.dependency)
+
+        with self.assertRaises(UnmetDependency) as cm:
+            self.accessor.getmany(('other.missing', 'missing'))
+        self.assertEqual(cm.exception.dependency, 'other.missing')
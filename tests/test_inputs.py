@@ -134,3 +134,31 @@ class InputTestCase(unittest.TestCase):
         for valid, result in {'000-00-0000': '000000000', '123456789': '123456789'}.items():
             self.assertTrue(ssn.valid(valid))
             self.assertEqual(ssn.value(valid), result)
+
+    def test_routing_number_input(self):
+        routing = RoutingNumberInput('routing_number', description="What is your routing number?")
+        routing.__form_init__(self.form)
+
+        for invalid in ['00', '000000000', '158374958', '3300000000', '13000000a', '21０000000']:
+            self.assertFalse(routing.valid(invalid))
+
+        for valid in ['012345678', '310000000', '258377691', '120000000', '210000000']:
+            self.assertTrue(routing.valid(valid))
+            self.assertEqual(routing.value(valid), valid)
+
+    def test_input_store_set_and_delete(self):
+        int_input = IntegerInput('count', description="How many?")
+        int_input.__form_init__(self.form)
+        store = InputStore(self.config, {int_input.name(): int_input})
+
+        with self.assertRaises(MissingInput):
+            store['0000.count']
+
+        store['0000.count'] = '3'
+        self.assertEqual(store['0000.count'], 3)
+        store['0000.count'] = '4'
+        self.assertEqual(store['0000.count'], 4)
+
+        del store['0000.count']
+        with self.assertRaises(MissingInput):
+            store['0000.count']
@@ -0,0 +1,65 @@
+import unittest
+
+from habutax.enum import filing_status as status
+from habutax.fields import *
+from habutax.pdf_fields import *
+
+
+class PDFFieldTestCase(unittest.TestCase):
+    def test_enum_button(self):
+        field = EnumField('filing_status', status, lambda s, i, v: None)
+        pdf_field = EnumButtonPDFField('c1_1[0]', 'filing_status', '1', status.Single)
+
+        self.assertEqual(pdf_field.value(status.Single, field), '1')
+        self.assertEqual(pdf_field.value(status.MarriedFilingJointly, field), 'Off')
+        self.assertEqual(pdf_field.value(status.HeadOfHousehold, field), 'Off')
+        self.assertEqual(pdf_field.value(None, field), 'Off')
+
+        # The value function is applied before comparing against the member
+        defaulted = EnumButtonPDFField('c1_2[0]', 'filing_status', '1', status.Single,
+                                    value_fn=lambda s, v, f: status.Single if v is None else v)
+        self.assertEqual(defaulted.value(None, field), '1')
+        self.assertEqual(defaulted.value(status.HeadOfHousehold, field), 'Off')
+
+    def test_text(self):
+        field = FloatField('amount', lambda s, i, v: None)
+
+        self.assertEqual(TextPDFField('f1_1[0]', 'amount').value(12.5, field), '12.50')
+        self.assertEqual(TextPDFField('f1_1[0]', 'amount', max_length=5).value(12.5, field), '12.50')
+        with self.assertRaises(PDFValueTooLong):
+            TextPDFField('f1_1[0]', 'amount', max_length=4).value(12.5, field)
+
+        negated = TextPDFField('f1_1[0]', 'amount', value_fn=lambda s, v, f: f.to_string(-v))
+        self.assertEqual(negated.value(12.5, field), '-12.50')
+
+    def test_button(self):
+        field = BooleanField('checked', lambda s, i, v: None)
+
+        pdf_field = ButtonPDFField('c1_1[0]', 'checked', '1')
+        self.assertEqual(pdf_field.value(True, field), '1')
+        self.assertEqual(pdf_field.value(False, field), 'Off')
+
+        inverted = ButtonPDFField('c1_1[0]', 'checked', '1', value_fn=lambda s, v, f: not v)
+        self.assertEqual(inverted.value(True, field), 'Off')
+        self.assertEqual(inverted.value(False, field), '1')
+
+    def test_choice(self):
+        field = StringField('state', lambda s, i, v: None)
+        pdf_field = ChoicePDFField('f1_1[0]', 'state', ['MN', 'WI'])
+
+        self.assertEqual(pdf_field.value('MN', field), 'MN')
+        with self.assertRaises(PDFInvalidChoiceValue):
+            pdf_field.value('IA', field)
+
+    def test_slots(self):
+        pdf_fields = [
+            TextPDFField('f1_1[0]', 'amount', max_length=4),
+            ButtonPDFField('c1_1[0]', 'checked', '1'),
+            EnumButtonPDFField('c1_2[0]', 'filing_status', '1', status.Single),
+            OptionlessButtonPDFField('c1_3[0]', 'unused'),
+            ChoicePDFField('f1_2[0]', 'state', ['MN']),
+        ]
+        for pdf_field in pdf_fields:
+            self.assertFalse(hasattr(pdf_field, '__dict__'))
+            with self.assertRaises(AttributeError):
+                pdf_field.unexpected = True
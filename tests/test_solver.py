@@ -23,6 +23,21 @@ class TestForm(Form):
         super().__init__(__class__, test_inputs, test_fields, [], **kwargs)
 
 
+class InputUserTestForm(Form):
+    form_name = "input_user"
+    tax_year = 1970
+
+    def __init__(self, **kwargs):
+        test_fields = [
+            # Only reads an input from TestForm, so TestForm is first added
+            # for its inputs only...
+            IntegerField('first', lambda s, i, v: i['test.bar']),
+            # ...and then in full, once one of its fields is needed
+            IntegerField('second', lambda s, i, v: v['first'] + v['test.foo']),
+        ]
+        super().__init__(__class__, [], test_fields, [], **kwargs)
+
+
 class DependencyTrackerTestCase(unittest.TestCase):
     def setUp(self):
         self.form = TestForm()
@@ -248,3 +263,24 @@ class SolverTestCase(unittest.TestCase):
         self.assertIn('test.something', dep['test.bar'])
 
         self.assertEqual(len(self.solver.unmet_field_dependencies()), 1)
+
+    def test_input_only_form_added_in_full(self):
+        instances = []
+        class CountingTestForm(TestForm):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                instances.append(self)
+
+        self.config['test'] = {'bar': '5'}
+        solver = Solver(self.inputs, [CountingTestForm, InputUserTestForm])
+        solved = solver.solve(['input_user'])
+
+        self.assertTrue(solved)
+        self.assertEqual(len(instances), 1)
+        self.assertIs(solver.forms['test'], instances[0])
+
+        solution = solver.solution()
+        self.assertEqual(solution['input_user']['second'], '10')
+        for field, value in (('foo', '5'), ('something', '5'), ('else', '0')):
+            self.assertIn(field, solution['test'])
+            self.assertEqual(solution['test'][field], value)
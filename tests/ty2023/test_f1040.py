@@ -26,3 +26,40 @@ class Form1040SimpleTestCase(FormTestCase):
         self.assertDollarsEqual(solution, '1040.35a', 2285.90) # refund
         self.assertDollarsEqual(solution, '1040.37', 0) # amount you owe
         self.assertDollarsEqual(solution, '1040.38', 0) # tax penalty
+
+
+class Form1040RetirementDistributionsTestCase(FormTestCase):
+    def setUp(self):
+        self.fixture_setup(ty2023.available_forms, input_fixture='tests/ty2023/fixtures/f1040_1099_r.habutax')
+
+    def test_1099_r(self):
+        solution = self.assertSolve(['1040'])
+
+        self.assertIn('1099-r:3', solution)
+
+        self.assertDollarsEqual(solution, '1040.4a', 12000) # your IRA distribution, all rolled over
+        self.assertDollarsEqual(solution, '1040.4b', 3000) # your spouse's IRA distribution
+        self.assertDollarsEqual(solution, '1040.5a', 20000 + 8000) # pensions
+        self.assertDollarsEqual(solution, '1040.5b', 15000 + 8000) # taxable pensions
+        self.assertDollarsEqual(solution, '1040.9', 100000 + 3000 + 23000) # total income
+        self.assertDollarsEqual(solution, '1040.12', 27700) # standard deduction
+        self.assertDollarsEqual(solution, '1040.15', 126000 - 27700) # taxable income
+        self.assertDollarsEqual(solution, '1040.16', 12247) # tax
+
+
+class Form1040RetirementDistributionsQCDTestCase(FormTestCase):
+    def setUp(self):
+        inputs = {
+            '1040.ira_exception3_spouse': 'yes',
+            '1040.ira_exception3_spouse_total': 'yes',
+        }
+        self.fixture_setup(ty2023.available_forms, input_fixture='tests/ty2023/fixtures/f1040_1099_r.habutax', inputs=inputs)
+
+    def test_1099_r(self):
+        solution = self.assertSolve(['1040'])
+
+        self.assertDollarsEqual(solution, '1040.4a', 12000 + 3000) # rolled over, and your spouse's QCD
+        self.assertDollarsEqual(solution, '1040.4b', 0)
+        self.assertDollarsEqual(solution, '1040.5a', 28000)
+        self.assertDollarsEqual(solution, '1040.5b', 23000)
+        self.assertDollarsEqual(solution, '1040.9', 100000 + 23000)
@@ -0,0 +1,69 @@
+import unittest
+
+from habutax.form import FormAccessor
+from habutax.values import ValueStore
+
+from habutax.forms.ty2023.f1040_sc import Form1040SC, NUM_FIELDS
+
+
+class Form1040SCPayersTestCase(unittest.TestCase):
+    def setUp(self):
+        self.form = Form1040SC()
+        self.fields = {f.name(): f for f in self.form.fields()}
+
+    def solve(self, inputs, values):
+        """Return a function returning the value of a payer or amount field of
+        this form, given the 1099 `inputs` and `values`"""
+        form_inputs = FormAccessor(inputs, self.form)
+        form_values = FormAccessor(ValueStore(values), self.form)
+        return lambda name: self.fields[f'1040_sc.{name}'].value(form_inputs, form_values)
+
+    def test_more_payers_than_rows(self):
+        count = NUM_FIELDS + 2
+        inputs = {
+            '1040.number_1099-int': count,
+            '1040.number_1099-div': count,
+        }
+        values = {}
+        for n in range(count):
+            values[f'1099-int:{n}.payer'] = f'Bank {n}'
+            values[f'1099-int:{n}.box_1'] = 100.0 * n
+            values[f'1099-int:{n}.box_3'] = 1.5
+            values[f'1099-div:{n}.payer'] = f'Fund {n}'
+            values[f'1099-div:{n}.box_1a'] = 10.0 * n
+        value = self.solve(inputs, values)
+
+        for n in range(NUM_FIELDS):
+            self.assertEqual(value(f'1_payer_{n}'), f'Bank {n}')
+            self.assertAlmostEqual(value(f'1_amount_{n}'), 100.0 * n + 1.5)
+            self.assertEqual(value(f'5_payer_{n}'), f'Fund {n}')
+            self.assertAlmostEqual(value(f'5_amount_{n}'), 10.0 * n)
+        self.assertNotIn(f'1040_sc.1_payer_{NUM_FIELDS}', self.fields)
+
+    def test_rows_past_count(self):
+        inputs = {
+            '1040.number_1099-int': 2,
+            '1040.number_1099-div': 0,
+        }
+        values = {
+            '1099-int:0.payer': 'Bank 0',
+            '1099-int:0.box_1': 20.0,
+            '1099-int:0.box_3': 5.25,
+            '1099-int:1.payer': 'Bank 1',
+            '1099-int:1.box_1': 0.0,
+            '1099-int:1.box_3': 12.0,
+        }
+        value = self.solve(inputs, values)
+
+        self.assertEqual(value('1_payer_0'), 'Bank 0')
+        self.assertAlmostEqual(value('1_amount_0'), 25.25)
+        self.assertEqual(value('1_payer_1'), 'Bank 1')
+        self.assertAlmostEqual(value('1_amount_1'), 12.0)
+        # Rows past the number of 1099s are None, which the fields turn into
+        # their empty values
+        for n in range(2, NUM_FIELDS):
+            self.assertEqual(value(f'1_payer_{n}'), '')
+            self.assertEqual(value(f'1_amount_{n}'), 0.0)
+        for n in range(NUM_FIELDS):
+            self.assertEqual(value(f'5_payer_{n}'), '')
+            self.assertEqual(value(f'5_amount_{n}'), 0.0)